@@ -0,0 +1,108 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled versions of the per-row string helpers in convert_csv_to_json.py.
+Behaviour must stay identical to the pure-Python functions there, which are
+used whenever this module has not been built:
+
+    cd scripts && python setup.py build_ext --inplace
+"""
+
+import re
+
+
+cdef str PREFER_HOST = "https://musicdott.app/groovescribe/GrooveEmbed.html"
+cdef str GROOVE_IFRAME_PREFIX = '<iframe width="100%" height="240" src="' + PREFER_HOST + '?'
+cdef str GROOVE_IFRAME_SUFFIX = '" frameborder="0"></iframe>'
+
+cdef str YOUTUBE_IFRAME_PREFIX = '<iframe width="560" height="315" src="https://www.youtube.com/embed/'
+cdef str YOUTUBE_IFRAME_SUFFIX = '" title="YouTube video player" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" referrerpolicy="strict-origin-when-cross-origin" allowfullscreen></iframe>'
+
+# Case-insensitive matching of 'src=' has Unicode corner cases, so keep the regex here
+IFRAME_SRC_RE = re.compile(r'src=["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+cdef inline str _groove_query(str url):
+    cdef Py_ssize_t idx = url.find('?')
+    if idx >= 0:
+        return url[idx + 1:]
+    idx = url.find('TimeSig=')
+    if idx >= 0:
+        return url[idx:]
+    return ""
+
+
+def normalize_groovescribe(str input_str) -> str:
+    """Compiled normalize_groovescribe: same three Groovescribe cases, same output"""
+    if not input_str:
+        return ""
+    cdef str s = input_str.strip()
+    if s.lower() == 'nan':
+        return ""
+
+    cdef str query
+
+    # Case 1: Already an iframe - extract src and normalize
+    if s.startswith('<iframe'):
+        if 'src=' in s.lower():
+            src_match = IFRAME_SRC_RE.search(s)
+            if src_match:
+                query = _groove_query(src_match.group(1))
+                if query:
+                    return GROOVE_IFRAME_PREFIX + query + GROOVE_IFRAME_SUFFIX
+
+    # Case 2: Full URL (musicdott.app or mikeslessons.com)
+    elif s.startswith('http'):
+        query = _groove_query(s)
+        if query:
+            return GROOVE_IFRAME_PREFIX + query + GROOVE_IFRAME_SUFFIX
+
+    # Case 3: Bare query (?TimeSig=... or TimeSig=...)
+    elif s.startswith('?TimeSig='):
+        return GROOVE_IFRAME_PREFIX + s[1:] + GROOVE_IFRAME_SUFFIX
+    elif s.startswith('TimeSig='):
+        return GROOVE_IFRAME_PREFIX + s + GROOVE_IFRAME_SUFFIX
+
+    return s
+
+
+cdef inline bint _is_video_id_char(Py_UCS4 c):
+    return (c >= u'a' and c <= u'z') or (c >= u'A' and c <= u'Z') or (c >= u'0' and c <= u'9') or c == u'_' or c == u'-'
+
+
+def youtube_url_to_iframe(url) -> str:
+    """Compiled youtube_url_to_iframe"""
+    if not url or not isinstance(url, str):
+        return ""
+    cdef str s = url.strip()
+    if s.lower() == 'nan':
+        return ""
+    return _youtube_url_to_iframe_fast(s)
+
+
+def _youtube_url_to_iframe_fast(str s) -> str:
+    """Compiled _youtube_url_to_iframe_fast: scans for the same markers as _YOUTUBE_RE without regex"""
+    cdef Py_ssize_t n = len(s)
+    cdef Py_ssize_t pos = s.find('youtu')
+    cdef Py_ssize_t start, end
+
+    # The leftmost 'youtu' followed by a known path and at least one id character wins
+    while pos >= 0:
+        if s.startswith('youtube.com/watch?v=', pos):
+            start = pos + 20
+        elif s.startswith('youtube.com/shorts/', pos):
+            start = pos + 19
+        elif s.startswith('youtu.be/', pos):
+            start = pos + 9
+        else:
+            start = -1
+
+        if start >= 0:
+            end = start
+            while end < n and _is_video_id_char(s[end]):
+                end += 1
+            if end > start:
+                return YOUTUBE_IFRAME_PREFIX + s[start:end] + YOUTUBE_IFRAME_SUFFIX
+
+        pos = s.find('youtu', pos + 1)
+
+    return s
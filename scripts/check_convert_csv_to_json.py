@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Regression checks for convert_csv_to_json.py
+
+Runs the converters on small edge-case CSVs and checks the records they build,
+and that the streamed JSON files match json.dump(records, indent=2).
+Usage: python scripts/check_convert_csv_to_json.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import convert_csv_to_json as converter  # noqa: E402
+
+
+# name -> (raw CSV bytes, song titles the songs converter must produce)
+EDGE_CASES = {
+    'extra_cell_late': (b'soTitel,soArtiest\nA,B\nC,D,EXTRA\nE,F\nG,H\n', ['A', 'C', 'E', 'G']),
+    'extra_cell_first_row': (b'soTitel,soArtiest\nA,B,EXTRA\nC,D\n', ['A', 'C']),
+    'missing_cells': (b'soTitel,soArtiest,soGenre\nA\nB,C,Rock\n', ['A', 'B']),
+    'duplicate_header': (b'soTitel,soArtiest,soTitel\nA,B,Z\n', ['Z']),
+    # A BOM stays part of the first header, so the title column is not found
+    'utf8_bom': (b'\xef\xbb\xbfsoTitel,soArtiest\nA,B\n', ['Song #1']),
+    'blank_and_multiline': (b'soTitel,soArtiest\n\nA,B\n\n"C\nD",E\n', ['A', 'C\nD']),
+    'nan_markers': (b'soTitel,soArtiest,soBPM\nnan, NaN ,nAn\n', ['Song #1']),
+    'header_only': (b'soTitel,soArtiest\n', []),
+    'empty': (b'', []),
+    'latin1': ('soTitel,soArtiest\ncafé,B\n'.encode('latin-1'), ['café']),
+}
+
+# Lesson time cells -> startTime the students converter must give them (None: no schedule entry)
+TIME_CASES = {
+    '15:30': '15:30',
+    '15.30': '15:30',
+    '9:5': '09:05',
+    ' 15:30 ': '15:30',
+    '15: 30': '15:30',
+    '15 :30': '15:30',
+    '15 : 30': '15:30',
+    'ab:cd': None,
+    '100:30': None,
+    '1530': None,
+    '15:30:00': None,
+}
+
+# Lesson duration cells -> durationMin the students converter must give them
+DURATION_CASES = {
+    '45': 45,
+    '+45': 45,
+    '-45': 30,
+    '4_5': 30,
+    '': 30,
+    'nan': 30,
+    'abc': 30,
+    '++45': 30,
+    # Wider than 64 bits: orjson rejects it, so writing it needs the json fallback
+    '99999999999999999999': 99999999999999999999,
+}
+
+STUDENTS_CSV = (
+    'stid,stVoornaam,stNaam,stEmail,stLesdag1,stLestijd1,stLesduur1,stLesdag2,stLestijd2,stLesduur2\n'
+    '1,Anna,Smit,anna@example.com,ma,15:30,45,Dinsdag,9.5,+45\n'
+    '2,Bram,Jansen,,xx,15:30,30,zo,23 : 59,99999999999999999999\n'
+    '3,Cas,de Vries,,nan,15:30,30,friday,ab:cd,30\n'
+)
+
+# (studentId, dayOfWeek, startTime, durationMin, RRULE) of each schedule entry from STUDENTS_CSV
+EXPECTED_SCHEDULE = [
+    ('1', 'MO', '15:30', 45, 'FREQ=WEEKLY;BYDAY=MO;BYHOUR=15;BYMINUTE=30;BYSECOND=0'),
+    ('1', 'TU', '09:05', 45, 'FREQ=WEEKLY;BYDAY=TU;BYHOUR=9;BYMINUTE=5;BYSECOND=0'),
+    ('2', 'SU', '23:59', 99999999999999999999, 'FREQ=WEEKLY;BYDAY=SU;BYHOUR=23;BYMINUTE=59;BYSECOND=0'),
+]
+WEEKDAYS = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
+
+
+def _quiet(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def _write(tmpdir: str, name: str, data: bytes) -> str:
+    path = os.path.join(tmpdir, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def _read(path: str) -> str:
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def _lesson_slots(tmpdir: str, name: str, cells: list) -> list:
+    """Schedule entries for one student per (time, duration) cell pair, in input order"""
+    rows = ''.join(f'{index},S,{index},ma,"{time_raw}","{duration_raw}"\n'
+                   for index, (time_raw, duration_raw) in enumerate(cells))
+    csv_file = _write(tmpdir, name, ('stid,stVoornaam,stNaam,stLesdag1,stLestijd1,stLesduur1\n' + rows).encode())
+    _, schedule = _quiet(converter.convert_students_csv_to_json, csv_file)
+    slots = [None] * len(cells)
+    for entry in schedule:
+        slots[int(entry['studentId'])] = entry
+    return slots
+
+
+def check_edge_cases(tmpdir: str) -> list:
+    failures = []
+    for name, (data, expected_titles) in EDGE_CASES.items():
+        csv_file = _write(tmpdir, f'{name}.csv', data)
+
+        songs = _quiet(converter.convert_songs_csv_to_json, csv_file)
+        titles = [song['title'] for song in songs]
+        if titles != expected_titles:
+            failures.append(f"{name}: song titles {titles!r}, expected {expected_titles!r}")
+
+    return failures
+
+
+def check_times(tmpdir: str) -> list:
+    failures = []
+    slots = _lesson_slots(tmpdir, 'times.csv', [(raw, '') for raw in TIME_CASES])
+    for (raw, expected), entry in zip(TIME_CASES.items(), slots):
+        start_time = entry['startTime'] if entry else None
+        if start_time != expected:
+            failures.append(f"time {raw!r}: startTime {start_time!r}, expected {expected!r}")
+    return failures
+
+
+def check_durations(tmpdir: str) -> list:
+    failures = []
+    slots = _lesson_slots(tmpdir, 'durations.csv', [('15:30', raw) for raw in DURATION_CASES])
+    for (raw, expected), entry in zip(DURATION_CASES.items(), slots):
+        duration_min = entry['durationMin'] if entry else None
+        if duration_min != expected:
+            failures.append(f"duration {raw!r}: durationMin {duration_min!r}, expected {expected!r}")
+    return failures
+
+
+def check_students(tmpdir: str) -> list:
+    failures = []
+    csv_file = _write(tmpdir, 'students.csv', STUDENTS_CSV.encode())
+    students, schedule = _quiet(converter.convert_students_csv_to_json, csv_file)
+
+    if [student['id'] for student in students] != ['1', '2', '3']:
+        failures.append(f"students: ids {[student['id'] for student in students]!r}")
+
+    found = [(e['studentId'], e['dayOfWeek'], e['startTime'], e['durationMin'], e['ical']['RRULE'])
+             for e in schedule]
+    if found != EXPECTED_SCHEDULE:
+        failures.append(f"schedule: {found!r}, expected {EXPECTED_SCHEDULE!r}")
+
+    # DTSTART is the next occurrence of the lesson day (1-7 days ahead) at the lesson time
+    today = datetime.now().date()
+    for entry in schedule:
+        ical = entry['ical']
+        date = datetime.strptime(ical['DTSTART'][:8], '%Y%m%d').date()
+        weekday = WEEKDAYS[entry['dayOfWeek']]
+        time_part = ical['DTSTART'][8:]
+        if date.weekday() != weekday or not 1 <= (date - today).days <= 7:
+            failures.append(f"schedule {entry['dayOfWeek']}: DTSTART {ical['DTSTART']!r} is not the next such day")
+        if time_part != f"T{entry['startTime'].replace(':', '')}00" or ical['TZID'] != 'Europe/Amsterdam':
+            failures.append(f"schedule {entry['dayOfWeek']}: ical {ical!r} does not match {entry['startTime']}")
+
+    # The streamed files must be byte-identical to json.dump, with and without orjson
+    orjson = converter.orjson
+    for label, module in (('orjson', orjson), ('json', None)):
+        if label == 'orjson' and orjson is None:
+            continue
+        converter.orjson = module
+        try:
+            outdir = os.path.join(tmpdir, f'students_{label}')
+            os.makedirs(outdir)
+            _quiet(converter._students_job, csv_file, outdir)
+        except TypeError as e:
+            failures.append(f"{label}: writing the students files failed: {e}")
+            continue
+        finally:
+            converter.orjson = orjson
+        for name, records in (('musicdott2_students.json', students), ('musicdott2_schedule.json', schedule)):
+            if _read(os.path.join(outdir, name)) != json.dumps(records, ensure_ascii=False, indent=2):
+                failures.append(f"{label}: {name} differs from json.dump(indent=2)")
+        if sorted(os.listdir(outdir)) != ['musicdott2_schedule.json', 'musicdott2_students.json']:
+            failures.append(f"{label}: unexpected files {sorted(os.listdir(outdir))!r}")
+
+    return failures
+
+
+def check_failed_write(tmpdir: str) -> list:
+    """A record that cannot be serialized must leave no output, or the previous output, behind"""
+    failures = []
+    outdir = os.path.join(tmpdir, 'failed_write')
+    os.makedirs(outdir)
+    output_file = os.path.join(outdir, 'out.json')
+    unserializable = {'value': object()}
+
+    for label, records in (('first record', [unserializable]), ('later record', [{'a': 1}, unserializable])):
+        try:
+            converter.write_json(records, output_file)
+            failures.append(f"failed write ({label}): no error raised")
+        except TypeError:
+            pass
+        if os.listdir(outdir):
+            failures.append(f"failed write ({label}): left {os.listdir(outdir)!r}")
+
+    # Even when a caller goes on after the error, a rejected record writes nothing
+    writer = converter.JsonArrayWriter(output_file)
+    for record in ({'a': 1}, unserializable, {'b': 2}, unserializable):
+        try:
+            writer.write(record)
+        except TypeError:
+            pass
+    writer.close()
+    if _read(output_file) != json.dumps([{'a': 1}, {'b': 2}], indent=2):
+        failures.append(f"failed write: rejected records left {_read(output_file)!r}")
+
+    previous = _read(output_file)
+    try:
+        converter.write_json([{'a': 2}, unserializable], output_file)
+    except TypeError:
+        pass
+    if _read(output_file) != previous or os.listdir(outdir) != ['out.json']:
+        failures.append("failed write: the previous output file was changed")
+
+    return failures
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        failures = check_edge_cases(tmpdir)
+        failures += check_times(tmpdir)
+        failures += check_durations(tmpdir)
+        failures += check_students(tmpdir)
+        failures += check_failed_write(tmpdir)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print("✅ convert_csv_to_json checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,10 @@
 Musicdott 1.0 CSV to Musicdott 2.0 JSON Converter
 Converts POS_Songs.csv and POS_Notatie.csv to the JSON format expected by Musicdott 2.0
 Enhanced with comprehensive Groovescribe normalization
+
+Pure standard-library Python, so it also runs under PyPy (see
+convert_csv_to_json.sh). orjson and the Cython helpers in _fast.pyx are
+optional and only used when they can be imported.
 """
 
 import csv
@@ -11,7 +15,54 @@ import argparse
 import os
 import sys
 import re
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json module is the fallback
+    orjson = None
+
+
+# Encodings tried in order when reading legacy Musicdott 1.0 exports
+CSV_ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+
+# Spellings of pandas' missing-value marker found in exported CSVs
+_NAN_VALUES = frozenset(['nan', 'NaN', 'NAN'])
+
+# Patterns are compiled once at import time; the helpers below run per CSV row
+_IFRAME_SRC_RE = re.compile(r'src=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Groovescribe embeds always point at the Musicdott-hosted player
+PREFER_HOST = "https://musicdott.app/groovescribe/GrooveEmbed.html"
+_GROOVE_IFRAME_PREFIX = f'<iframe width="100%" height="240" src="{PREFER_HOST}?'
+_GROOVE_IFRAME_SUFFIX = '" frameborder="0"></iframe>'
+
+# Handle different YouTube URL formats (watch, youtu.be, shorts, mobile)
+_YOUTUBE_RE = re.compile(
+    r'(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/(?:watch\?v=|shorts/)|youtu\.be/)([a-zA-Z0-9_-]+)'
+)
+_YOUTUBE_IFRAME_PREFIX = '<iframe width="560" height="315" src="https://www.youtube.com/embed/'
+_YOUTUBE_IFRAME_SUFFIX = '" title="YouTube video player" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" referrerpolicy="strict-origin-when-cross-origin" allowfullscreen></iframe>'
+
+# Lesson times as exported: 15:30, 15.30, 9:5, with optional spaces around the separator
+_TIME_RE = re.compile(r'^\s*(\d{1,2})\s*[:.]\s*(\d{1,2})\s*$')
+
+# Day name mappings
+_DAY_MAPPING = {
+    'ma': 'MO', 'maandag': 'MO', 'monday': 'MO',
+    'di': 'TU', 'dinsdag': 'TU', 'tuesday': 'TU', 
+    'wo': 'WE', 'woensdag': 'WE', 'wednesday': 'WE',
+    'do': 'TH', 'donderdag': 'TH', 'thursday': 'TH',
+    'vr': 'FR', 'vrijdag': 'FR', 'friday': 'FR',
+    'za': 'SA', 'zaterdag': 'SA', 'saturday': 'SA',
+    'zo': 'SU', 'zondag': 'SU', 'sunday': 'SU'
+}
+
+# Python weekday() index of each iCal BYDAY code
+_DAY_INDEX = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
 
 
 def normalize_groovescribe(input_str: str) -> str:
@@ -23,11 +74,10 @@ def normalize_groovescribe(input_str: str) -> str:
         return ""
     
     s = str(input_str).strip()
-    PREFER_HOST = "https://musicdott.app/groovescribe/GrooveEmbed.html"
     
     # Case 1: Already an iframe - extract src and normalize
     if s.startswith('<iframe'):
-        src_match = re.search(r'src=["\']([^"\']+)["\']', s, re.IGNORECASE)
+        src_match = _IFRAME_SRC_RE.search(s) if 'src=' in s.lower() else None
         if src_match:
             src_url = src_match.group(1)
             # Extract query parameters
@@ -39,7 +89,7 @@ def normalize_groovescribe(input_str: str) -> str:
                 query = ""
             
             if query:
-                return f'<iframe width="100%" height="240" src="{PREFER_HOST}?{query}" frameborder="0"></iframe>'
+                return _GROOVE_IFRAME_PREFIX + query + _GROOVE_IFRAME_SUFFIX
     
     # Case 2: Full URL (musicdott.app or mikeslessons.com)
     elif s.startswith('http'):
@@ -51,393 +101,492 @@ def normalize_groovescribe(input_str: str) -> str:
             query = ""
         
         if query:
-            return f'<iframe width="100%" height="240" src="{PREFER_HOST}?{query}" frameborder="0"></iframe>'
+            return _GROOVE_IFRAME_PREFIX + query + _GROOVE_IFRAME_SUFFIX
     
     # Case 3: Bare query (?TimeSig=... or TimeSig=...)
     elif s.startswith('?TimeSig=') or s.startswith('TimeSig='):
         query = s[1:] if s.startswith('?') else s
-        return f'<iframe width="100%" height="240" src="{PREFER_HOST}?{query}" frameborder="0"></iframe>'
+        return _GROOVE_IFRAME_PREFIX + query + _GROOVE_IFRAME_SUFFIX
     
     # Return as-is if not recognizable Groovescribe content
     return s
 
 
+def _youtube_url_to_iframe_fast(s: str) -> str:
+    """youtube_url_to_iframe for values already cleaned by _normalize_row (stripped str, not 'nan')"""
+    # Cheap substring reject before running the regex (the pattern is case-sensitive too)
+    if 'youtu' not in s:
+        return s
+    
+    match = _YOUTUBE_RE.search(s)
+    if match:
+        video_id = match.group(1)
+        return _YOUTUBE_IFRAME_PREFIX + video_id + _YOUTUBE_IFRAME_SUFFIX
+    
+    return s
+
+
 def youtube_url_to_iframe(url: str) -> str:
     """Convert YouTube URL to iframe embed HTML"""
     if not url or not isinstance(url, str) or url.strip().lower() == 'nan':
         return ""
     
-    s = str(url).strip()
+    return _youtube_url_to_iframe_fast(url.strip())
+
+
+try:
+    # Compiled drop-in replacements, see _fast.pyx and setup.py
+    from _fast import normalize_groovescribe, youtube_url_to_iframe, _youtube_url_to_iframe_fast
+except ImportError:
+    pass
+
+
+@lru_cache(maxsize=256)
+def _day_code(day_raw: str):
+    """iCal BYDAY code for an exported day name; a handful of spellings repeat for every student"""
+    return _DAY_MAPPING.get(day_raw.lower().strip())
+
+
+@lru_cache(maxsize=2048)
+def _rrule(day_code: str, hours: int, minutes: int) -> str:
+    """Weekly iCal RRULE; lesson slots repeat across students, so the strings are shared"""
+    return f"FREQ=WEEKLY;BYDAY={day_code};BYHOUR={hours};BYMINUTE={minutes};BYSECOND=0"
+
+
+def _clean_value(value) -> str:
+    """Strip a CSV cell; missing cells and pandas' 'nan' marker become ''"""
+    if value is None or value in _NAN_VALUES:
+        return ""
+    value = value.strip()
+    # Only a three-character value can still be a padded/mixed-case 'nan'
+    if len(value) == 3 and value.lower() == 'nan':
+        return ""
+    return value
+
+
+def _normalize_row(row: Dict) -> Dict[str, str]:
+    """Clean every field of a CSV row once with _clean_value"""
+    # DictReader stores surplus cells under a None key
+    return {key: _clean_value(value) for key, value in row.items() if key is not None}
+
+
+def _open_csv(csv_file: str):
+    """Open a CSV file for streaming with the first encoding that decodes it"""
+    # Parse CSV with high field size limit
+    csv.field_size_limit(1000000)  # 1MB field limit
+    
+    for encoding in CSV_ENCODINGS:
+        file = open(csv_file, 'r', encoding=encoding, newline='')
+        try:
+            # Decode the whole file in chunks so a bad byte late in the
+            # file is caught here without holding the file in memory
+            while file.read(65536):
+                pass
+        except UnicodeDecodeError:
+            file.close()
+            continue
+        
+        file.seek(0)
+        print(f"Successfully read {csv_file} with {encoding} encoding")
+        return file
     
-    # Handle different YouTube URL formats
-    youtube_patterns = [
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)',
-        r'(?:https?://)?(?:www\.)?youtu\.be/([a-zA-Z0-9_-]+)',
-        r'(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]+)',
-        r'(?:https?://)?(?:m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)'
-    ]
+    raise Exception(f"Could not read {csv_file} with any supported encoding")
+
+
+def _build_song(fields: Dict[str, str], row_num: int) -> Dict[str, Any]:
+    """Build a Musicdott 2.0 song object from a normalized POS_Songs.csv row"""
+    # Extract basic info
+    title = fields.get('soTitel', "") or fields.get('titel', "") or f"Song #{row_num}"
+    artist = fields.get('soArtiest', "") or fields.get('artiest', "") or "Unknown Artist"
     
-    for pattern in youtube_patterns:
-        match = re.search(pattern, s)
-        if match:
-            video_id = match.group(1)
-            return f'<iframe width="560" height="315" src="https://www.youtube.com/embed/{video_id}" title="YouTube video player" frameborder="0" allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share" referrerpolicy="strict-origin-when-cross-origin" allowfullscreen></iframe>'
+    # Build description from genre, BPM, length
+    desc_parts = []
+    genre = fields.get('soGenre', "") or fields.get('genre', "")
+    bpm = fields.get('soBPM', "") or fields.get('bpm', "")
+    length = fields.get('soLengte', "") or fields.get('lengte', "")
     
-    return s
+    if genre and genre != "0":
+        desc_parts.append(f"Genre: {genre}")
+    if bpm and bpm != "0":
+        desc_parts.append(f"BPM: {bpm}")
+    if length and length != "0":
+        desc_parts.append(f"Lengte: {length}")
+    
+    description = " | ".join(desc_parts)
+    
+    # Build content from various sources
+    content_parts = []
+    
+    # YouTube (convert to iframe)
+    youtube = fields.get('soYouTube', "") or fields.get('youtube', "")
+    if youtube:
+        iframe = _youtube_url_to_iframe_fast(youtube)
+        if iframe:
+            content_parts.append(iframe)
+    
+    # Spotify, Apple Music, Lyrics (keep as URLs)
+    spotify = fields.get('soSpotify', "") or fields.get('spotify', "")
+    if spotify:
+        content_parts.append(f"Spotify: {spotify}")
+    
+    apple = fields.get('soAppleMusic', "") or fields.get('apple_music', "")
+    if apple:
+        content_parts.append(f"Apple Music: {apple}")
+    
+    lyrics = fields.get('soLyrics', "") or fields.get('lyrics', "")
+    if lyrics:
+        content_parts.append(f"Lyrics: {lyrics}")
+    
+    # Groovescribe notations (enhanced normalization)
+    for i in range(1, 4):  # soNotatie01, soNotatie02, soNotatie03
+        notation = fields.get(f'soNotatie0{i}', "") or fields.get(f'notatie0{i}', "")
+        if notation:
+            normalized_groove = normalize_groovescribe(notation)
+            if normalized_groove:
+                content_parts.append(normalized_groove)
+                
+                # Add corresponding remarks
+                remarks = fields.get(f'soOpmerkingen0{i}', "") or fields.get(f'opmerkingen0{i}', "")
+                if remarks:
+                    content_parts.append(f"Note: {remarks}")
+    
+    # Create song object
+    song = {
+        "title": title,
+        "artist": artist,
+        "instrument": "drums",
+        "level": "all",
+        "description": description,
+        "content": "\n\n".join(content_parts)
+    }
+    
+    return song
 
 
-def safe_get(row: Dict, key: str, default: str = "") -> str:
-    """Safely get value from CSV row with fallback"""
-    value = row.get(key, default)
-    if value is None or str(value).strip().lower() == 'nan':
-        return default
-    return str(value).strip()
+def iter_songs(csv_file: str) -> Iterator[Dict[str, Any]]:
+    """Yield Musicdott 2.0 song objects from POS_Songs.csv, one per CSV row"""
+    try:
+        with _open_csv(csv_file) as file:
+            reader = csv.DictReader(file)
+            
+            for row_num, row in enumerate(reader, 1):
+                try:
+                    song = _build_song(_normalize_row(row), row_num)
+                except Exception as e:
+                    print(f"Warning: Error processing song row {row_num}: {e}")
+                    continue
+                
+                yield song
+    
+    except Exception as e:
+        print(f"Error reading songs CSV: {e}")
 
 
 def convert_songs_csv_to_json(csv_file: str) -> List[Dict[str, Any]]:
     """Convert POS_Songs.csv to Musicdott 2.0 songs JSON format"""
-    songs = []
+    return list(iter_songs(csv_file))
+
+
+def _build_lesson(fields: Dict[str, str], row_num: int) -> Dict[str, Any]:
+    """Build a Musicdott 2.0 lesson object from a normalized POS_Notatie.csv row"""
+    # Build title from category, chapter, sequence
+    category = fields.get('noCategorie', "") or fields.get('categorie', "")
+    chapter = fields.get('noHoofdstuk', "") or fields.get('hoofdstuk', "")
+    sequence = fields.get('noVolgnummer', "") or fields.get('volgnummer', "")
+    
+    if category and chapter and sequence:
+        title = f"{category} – {chapter} – #{sequence}"
+    elif category and sequence:
+        title = f"{category} – #{sequence}"
+    else:
+        title = f"Pattern #{row_num}"
+    
+    # Description from remarks
+    description = fields.get('noOpmerkingen', "") or fields.get('opmerkingen', "")
+    
+    # Build content from notation and sources
+    content_parts = []
+    
+    # Main notation (enhanced normalization)
+    notation = fields.get('noNotatie', "") or fields.get('notatie', "")
+    if notation:
+        normalized_groove = normalize_groovescribe(notation)
+        if normalized_groove:
+            content_parts.append(normalized_groove)
+    
+    # Video sources
+    video = fields.get('noVideo', "") or fields.get('video', "")
+    if video:
+        iframe = _youtube_url_to_iframe_fast(video)
+        if iframe:
+            content_parts.append(f"Video: {iframe}")
+    
+    # Other sources
+    musescore = fields.get('noMusescore', "") or fields.get('musescore', "")
+    if musescore:
+        content_parts.append(f"MuseScore: {musescore}")
+    
+    musicxml = fields.get('musicxml', "")
+    if musicxml:
+        content_parts.append(f"MusicXML: {musicxml}")
+    
+    pdf_lesson = fields.get('noPDFlesson', "") or fields.get('pdf_lesson', "")
+    if pdf_lesson:
+        content_parts.append(f"PDF: {pdf_lesson}")
+    
+    mp3 = fields.get('noMP3', "") or fields.get('mp3', "")
+    if mp3:
+        content_parts.append(f"MP3: {mp3}")
     
+    # Create lesson object
+    lesson = {
+        "title": title,
+        "description": description,
+        "contentType": "notation",
+        "instrument": "drums",
+        "level": "all",
+        "content": "\n\n".join(content_parts)
+    }
+    
+    return lesson
+
+
+def iter_lessons(csv_file: str) -> Iterator[Dict[str, Any]]:
+    """Yield Musicdott 2.0 lesson objects from POS_Notatie.csv, one per CSV row"""
     try:
-        # Try different encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        csv_data = None
-        
-        for encoding in encodings:
-            try:
-                with open(csv_file, 'r', encoding=encoding, newline='') as file:
-                    csv_data = file.read()
-                    print(f"Successfully read {csv_file} with {encoding} encoding")
-                    break
-            except UnicodeDecodeError:
-                continue
-        
-        if csv_data is None:
-            raise Exception(f"Could not read {csv_file} with any supported encoding")
-        
-        # Parse CSV with high field size limit
-        csv.field_size_limit(1000000)  # 1MB field limit
-        
-        from io import StringIO
-        reader = csv.DictReader(StringIO(csv_data))
-        
-        for row_num, row in enumerate(reader, 1):
-            try:
-                # Extract basic info
-                title = safe_get(row, 'soTitel') or safe_get(row, 'titel') or f"Song #{row_num}"
-                artist = safe_get(row, 'soArtiest') or safe_get(row, 'artiest') or "Unknown Artist"
-                
-                # Build description from genre, BPM, length
-                desc_parts = []
-                genre = safe_get(row, 'soGenre') or safe_get(row, 'genre')
-                bpm = safe_get(row, 'soBPM') or safe_get(row, 'bpm')
-                length = safe_get(row, 'soLengte') or safe_get(row, 'lengte')
-                
-                if genre and genre != "0":
-                    desc_parts.append(f"Genre: {genre}")
-                if bpm and bpm != "0":
-                    desc_parts.append(f"BPM: {bpm}")
-                if length and length != "0":
-                    desc_parts.append(f"Lengte: {length}")
-                
-                description = " | ".join(desc_parts) if desc_parts else ""
-                
-                # Build content from various sources
-                content_parts = []
-                
-                # YouTube (convert to iframe)
-                youtube = safe_get(row, 'soYouTube') or safe_get(row, 'youtube')
-                if youtube:
-                    iframe = youtube_url_to_iframe(youtube)
-                    if iframe:
-                        content_parts.append(iframe)
-                
-                # Spotify, Apple Music, Lyrics (keep as URLs)
-                spotify = safe_get(row, 'soSpotify') or safe_get(row, 'spotify')
-                if spotify:
-                    content_parts.append(f"Spotify: {spotify}")
-                
-                apple = safe_get(row, 'soAppleMusic') or safe_get(row, 'apple_music')
-                if apple:
-                    content_parts.append(f"Apple Music: {apple}")
-                
-                lyrics = safe_get(row, 'soLyrics') or safe_get(row, 'lyrics')
-                if lyrics:
-                    content_parts.append(f"Lyrics: {lyrics}")
-                
-                # Groovescribe notations (enhanced normalization)
-                for i in range(1, 4):  # soNotatie01, soNotatie02, soNotatie03
-                    notation = safe_get(row, f'soNotatie0{i}') or safe_get(row, f'notatie0{i}')
-                    if notation:
-                        normalized_groove = normalize_groovescribe(notation)
-                        if normalized_groove:
-                            content_parts.append(normalized_groove)
-                            
-                            # Add corresponding remarks
-                            remarks = safe_get(row, f'soOpmerkingen0{i}') or safe_get(row, f'opmerkingen0{i}')
-                            if remarks:
-                                content_parts.append(f"Note: {remarks}")
-                
-                # Create song object
-                song = {
-                    "title": title,
-                    "artist": artist,
-                    "instrument": "drums",
-                    "level": "all",
-                    "description": description,
-                    "content": "\n\n".join(content_parts)
-                }
-                
-                songs.append(song)
-                
-            except Exception as e:
-                print(f"Warning: Error processing song row {row_num}: {e}")
-                continue
+        with _open_csv(csv_file) as file:
+            reader = csv.DictReader(file)
+            
+            for row_num, row in enumerate(reader, 1):
+                try:
+                    lesson = _build_lesson(_normalize_row(row), row_num)
+                except Exception as e:
+                    print(f"Warning: Error processing notation row {row_num}: {e}")
+                    continue
                 
+                yield lesson
+    
     except Exception as e:
-        print(f"Error reading songs CSV: {e}")
-        
-    return songs
+        print(f"Error reading notation CSV: {e}")
 
 
 def convert_notatie_csv_to_json(csv_file: str) -> List[Dict[str, Any]]:
     """Convert POS_Notatie.csv to Musicdott 2.0 lessons JSON format"""
-    lessons = []
+    return list(iter_lessons(csv_file))
+
+
+def _build_student_records(fields: Dict[str, str], row_num: int, next_dates: Dict[str, str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield the student and schedule records for one normalized students export row"""
+    # Extract student info
+    student_id = fields.get('stid', "") or str(row_num)
+    first_name = fields.get('stVoornaam', "")
+    last_name = fields.get('stNaam', "")
+    email = fields.get('stEmail', "")
+    phone = fields.get('stTelefoonmobiel', "") or fields.get('stTelefoonvast', "")
+    city = fields.get('stWoonplaats', "")
+    notes = fields.get('stOpmerkingen', "")
     
-    try:
-        # Try different encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        csv_data = None
-        
-        for encoding in encodings:
-            try:
-                with open(csv_file, 'r', encoding=encoding, newline='') as file:
-                    csv_data = file.read()
-                    print(f"Successfully read {csv_file} with {encoding} encoding")
-                    break
-            except UnicodeDecodeError:
-                continue
-        
-        if csv_data is None:
-            raise Exception(f"Could not read {csv_file} with any supported encoding")
-        
-        # Parse CSV with high field size limit
-        csv.field_size_limit(1000000)  # 1MB field limit
+    # Create student object
+    student = {
+        "id": student_id,
+        "firstName": first_name,
+        "lastName": last_name, 
+        "fullName": f"{first_name} {last_name}".strip(),
+        "email": email if email and email != "nan" else None,
+        "phone": phone if phone and phone != "nan" else None,
+        "city": city if city and city != "nan" else None,
+        "notes": notes if notes and notes != "nan" else None,
+        "instrument": "drums"
+    }
+    yield 'students', student
+    
+    # Process lesson schedule (up to 2 lessons per student)
+    for i in [1, 2]:
+        day_key = f'stLesdag{i}'
+        time_key = f'stLestijd{i}'
+        duration_key = f'stLesduur{i}'
         
-        from io import StringIO
-        reader = csv.DictReader(StringIO(csv_data))
+        day_raw = fields.get(day_key, "")
+        time_raw = fields.get(time_key, "")
+        duration_raw = fields.get(duration_key, "")
         
-        for row_num, row in enumerate(reader, 1):
-            try:
-                # Build title from category, chapter, sequence
-                category = safe_get(row, 'noCategorie') or safe_get(row, 'categorie')
-                chapter = safe_get(row, 'noHoofdstuk') or safe_get(row, 'hoofdstuk')
-                sequence = safe_get(row, 'noVolgnummer') or safe_get(row, 'volgnummer')
-                
-                if category and chapter and sequence:
-                    title = f"{category} – {chapter} – #{sequence}"
-                elif category and sequence:
-                    title = f"{category} – #{sequence}"
-                else:
-                    title = f"Pattern #{row_num}"
-                
-                # Description from remarks
-                description = safe_get(row, 'noOpmerkingen') or safe_get(row, 'opmerkingen')
-                
-                # Build content from notation and sources
-                content_parts = []
-                
-                # Main notation (enhanced normalization)
-                notation = safe_get(row, 'noNotatie') or safe_get(row, 'notatie')
-                if notation:
-                    normalized_groove = normalize_groovescribe(notation)
-                    if normalized_groove:
-                        content_parts.append(normalized_groove)
-                
-                # Video sources
-                video = safe_get(row, 'noVideo') or safe_get(row, 'video')
-                if video:
-                    iframe = youtube_url_to_iframe(video)
-                    if iframe:
-                        content_parts.append(f"Video: {iframe}")
-                
-                # Other sources
-                musescore = safe_get(row, 'noMusescore') or safe_get(row, 'musescore')
-                if musescore:
-                    content_parts.append(f"MuseScore: {musescore}")
-                
-                musicxml = safe_get(row, 'musicxml')
-                if musicxml:
-                    content_parts.append(f"MusicXML: {musicxml}")
-                
-                pdf_lesson = safe_get(row, 'noPDFlesson') or safe_get(row, 'pdf_lesson')
-                if pdf_lesson:
-                    content_parts.append(f"PDF: {pdf_lesson}")
-                
-                mp3 = safe_get(row, 'noMP3') or safe_get(row, 'mp3')
-                if mp3:
-                    content_parts.append(f"MP3: {mp3}")
-                
-                # Create lesson object
-                lesson = {
-                    "title": title,
-                    "description": description,
-                    "contentType": "notation",
-                    "instrument": "drums",
-                    "level": "all",
-                    "content": "\n\n".join(content_parts)
-                }
-                
-                lessons.append(lesson)
-                
-            except Exception as e:
-                print(f"Warning: Error processing notation row {row_num}: {e}")
-                continue
-                
-    except Exception as e:
-        print(f"Error reading notation CSV: {e}")
+        if not day_raw or not time_raw or day_raw == "nan" or time_raw == "nan":
+            continue
         
-    return lessons
-
-
-def convert_students_csv_to_json(csv_file: str) -> tuple[list, list]:
-    """Convert Musicdott_fullexport_students.csv to students + schedule JSON"""
-    students = []
-    schedule = []
-    
-    try:
-        # Try different encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-        csv_data = None
+        # Parse day
+        day_code = _day_code(day_raw)
+        if not day_code:
+            continue
         
-        for encoding in encodings:
-            try:
-                with open(csv_file, 'r', encoding=encoding, newline='') as file:
-                    csv_data = file.read()
-                    print(f"Successfully read {csv_file} with {encoding} encoding")
-                    break
-            except UnicodeDecodeError:
-                continue
+        # Parse time (15:30 or 15.30)
+        time_match = _TIME_RE.match(time_raw)
+        if not time_match:
+            continue
         
-        if csv_data is None:
-            raise Exception(f"Could not read {csv_file} with any supported encoding")
+        hours = int(time_match.group(1))
+        minutes = int(time_match.group(2))
+        start_time = f"{hours:02d}:{minutes:02d}"
         
-        # Parse CSV with high field size limit
-        csv.field_size_limit(1000000)  # 1MB field limit
+        # Parse duration in whole minutes (default 30); int() also took a leading '+'
+        duration_digits = duration_raw[1:] if duration_raw.startswith('+') else duration_raw
+        duration_min = int(duration_digits) if duration_digits.isdecimal() else 30
         
-        from io import StringIO
-        reader = csv.DictReader(StringIO(csv_data))
+        dtstart = f"{next_dates[day_code]}T{start_time.replace(':', '')}00"
         
-        # Day name mappings
-        day_mapping = {
-            'ma': 'MO', 'maandag': 'MO', 'monday': 'MO',
-            'di': 'TU', 'dinsdag': 'TU', 'tuesday': 'TU', 
-            'wo': 'WE', 'woensdag': 'WE', 'wednesday': 'WE',
-            'do': 'TH', 'donderdag': 'TH', 'thursday': 'TH',
-            'vr': 'FR', 'vrijdag': 'FR', 'friday': 'FR',
-            'za': 'SA', 'zaterdag': 'SA', 'saturday': 'SA',
-            'zo': 'SU', 'zondag': 'SU', 'sunday': 'SU'
+        # Create schedule entry
+        schedule_entry = {
+            "studentId": student_id,
+            "studentName": student["fullName"],
+            "email": email,
+            "dayOfWeek": day_code,
+            "startTime": start_time,
+            "durationMin": duration_min,
+            "timezone": "Europe/Amsterdam",
+            "frequency": "WEEKLY",
+            "ical": {
+                "DTSTART": dtstart,
+                "TZID": "Europe/Amsterdam",
+                "RRULE": _rrule(day_code, hours, minutes)
+            },
+            "notes": notes if notes and notes != "nan" else None
         }
-        
-        for row_num, row in enumerate(reader, 1):
-            try:
-                # Extract student info
-                student_id = safe_get(row, 'stid') or str(row_num)
-                first_name = safe_get(row, 'stVoornaam')
-                last_name = safe_get(row, 'stNaam')
-                email = safe_get(row, 'stEmail')
-                phone = safe_get(row, 'stTelefoonmobiel') or safe_get(row, 'stTelefoonvast')
-                city = safe_get(row, 'stWoonplaats')
-                notes = safe_get(row, 'stOpmerkingen')
-                
-                # Create student object
-                student = {
-                    "id": student_id,
-                    "firstName": first_name,
-                    "lastName": last_name, 
-                    "fullName": f"{first_name} {last_name}".strip(),
-                    "email": email if email and email != "nan" else None,
-                    "phone": phone if phone and phone != "nan" else None,
-                    "city": city if city and city != "nan" else None,
-                    "notes": notes if notes and notes != "nan" else None,
-                    "instrument": "drums"
-                }
-                students.append(student)
-                
-                # Process lesson schedule (up to 2 lessons per student)
-                for i in [1, 2]:
-                    day_key = f'stLesdag{i}'
-                    time_key = f'stLestijd{i}'
-                    duration_key = f'stLesduur{i}'
-                    
-                    day_raw = safe_get(row, day_key)
-                    time_raw = safe_get(row, time_key)
-                    duration_raw = safe_get(row, duration_key)
-                    
-                    if not day_raw or not time_raw or day_raw == "nan" or time_raw == "nan":
-                        continue
-                    
-                    # Parse day
-                    day_code = day_mapping.get(day_raw.lower().strip())
-                    if not day_code:
-                        continue
-                    
-                    # Parse time (15:30 or 15.30)
-                    time_clean = time_raw.replace('.', ':')
-                    if ':' not in time_clean or len(time_clean.split(':')) != 2:
-                        continue
-                    
-                    try:
-                        hours, minutes = time_clean.split(':')
-                        hours = int(hours)
-                        minutes = int(minutes)
-                        start_time = f"{hours:02d}:{minutes:02d}"
-                    except:
-                        continue
-                    
-                    # Parse duration (default 30 minutes)
-                    try:
-                        duration_min = int(duration_raw) if duration_raw and duration_raw != "nan" else 30
-                    except:
-                        duration_min = 30
-                    
-                    # Calculate next occurrence for iCal DTSTART
-                    from datetime import datetime, timedelta
-                    today = datetime.now()
-                    days_ahead = ['MO','TU','WE','TH','FR','SA','SU'].index(day_code)
-                    days_ahead = (days_ahead - today.weekday()) % 7
-                    if days_ahead == 0:  # Today
-                        days_ahead = 7  # Next week
-                    next_occurrence = today + timedelta(days=days_ahead)
-                    dtstart = f"{next_occurrence.strftime('%Y%m%d')}T{start_time.replace(':', '')}00"
-                    
-                    # Create schedule entry
-                    schedule_entry = {
-                        "studentId": student_id,
-                        "studentName": student["fullName"],
-                        "email": email,
-                        "dayOfWeek": day_code,
-                        "startTime": start_time,
-                        "durationMin": duration_min,
-                        "timezone": "Europe/Amsterdam",
-                        "frequency": "WEEKLY",
-                        "ical": {
-                            "DTSTART": dtstart,
-                            "TZID": "Europe/Amsterdam",
-                            "RRULE": f"FREQ=WEEKLY;BYDAY={day_code};BYHOUR={hours};BYMINUTE={minutes};BYSECOND=0"
-                        },
-                        "notes": notes if notes and notes != "nan" else None
-                    }
-                    schedule.append(schedule_entry)
-                    
-            except Exception as e:
-                print(f"Warning: Error processing student row {row_num}: {e}")
-                continue
-                
+        yield 'schedule', schedule_entry
+
+
+def iter_student_records(csv_file: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield ('students', student) and ('schedule', entry) pairs from the students export"""
+    try:
+        with _open_csv(csv_file) as file:
+            reader = csv.DictReader(file)
+            
+            # Next occurrence of each weekday for iCal DTSTART (today rolls over to next week)
+            today = datetime.now()
+            today_weekday = today.weekday()
+            next_dates = {
+                day_code: (today + timedelta(days=(index - today_weekday) % 7 or 7)).strftime('%Y%m%d')
+                for day_code, index in _DAY_INDEX.items()
+            }
+            
+            for row_num, row in enumerate(reader, 1):
+                try:
+                    yield from _build_student_records(_normalize_row(row), row_num, next_dates)
+                except Exception as e:
+                    print(f"Warning: Error processing student row {row_num}: {e}")
+                    continue
+    
     except Exception as e:
         print(f"Error reading students CSV: {e}")
-        
-    return students, schedule
+
+
+def convert_students_csv_to_json(csv_file: str) -> tuple[list, list]:
+    """Convert Musicdott_fullexport_students.csv to students + schedule JSON"""
+    output = {'students': [], 'schedule': []}
+    for kind, record in iter_student_records(csv_file):
+        output[kind].append(record)
+    return output['students'], output['schedule']
+
+
+def _dumps_record(record: Any) -> str:
+    """Serialize one record as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            # orjson rejects what json accepts too, e.g. ints wider than 64 bits
+            pass
+    return json.dumps(record, ensure_ascii=False, indent=2)
+
+
+class JsonArrayWriter:
+    """
+    Writes records to a JSON array file one at a time, so output memory does not
+    grow with the export. The layout matches json.dump(records, indent=2).
+    Records go to a temporary file that replaces output_file only when the array
+    is closed without an error, so a failed job never leaves a finished-looking file.
+    """
+    
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self.temp_file = f"{output_file}.tmp"
+        self.file = open(self.temp_file, 'w', encoding='utf-8')
+        self.count = 0
+    
+    def write(self, record: Any) -> None:
+        # Serialize first: a record that fails must not leave a separator behind
+        # Newlines inside JSON strings are escaped, so this only indents the layout
+        body = _dumps_record(record).replace('\n', '\n  ')
+        self.file.write((',\n  ' if self.count else '[\n  ') + body)
+        self.count += 1
+    
+    def close(self) -> None:
+        self.file.write('\n]' if self.count else '[]')
+        self.file.close()
+        os.replace(self.temp_file, self.output_file)
+    
+    def discard(self) -> None:
+        """Drop the partial output, leaving any existing output_file untouched"""
+        self.file.close()
+        os.remove(self.temp_file)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def write_json(records: Iterable[Any], output_file: str) -> int:
+    """Stream records into output_file as a JSON array, returning how many were written"""
+    with JsonArrayWriter(output_file) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
+
+
+def _songs_job(csv_file: str, outdir: str) -> List[str]:
+    """Convert songs and write musicdott2_songs.json, returning summary lines"""
+    output_file = os.path.join(outdir, 'musicdott2_songs.json')
+    count = write_json(iter_songs(csv_file), output_file)
+    
+    return [f"✅ Converted {count} songs to {output_file}"]
+
+
+def _lessons_job(csv_file: str, outdir: str) -> List[str]:
+    """Convert notation and write musicdott2_lessons.json, returning summary lines"""
+    output_file = os.path.join(outdir, 'musicdott2_lessons.json')
+    count = write_json(iter_lessons(csv_file), output_file)
+    
+    return [f"✅ Converted {count} lessons to {output_file}"]
+
+
+def _students_job(csv_file: str, outdir: str) -> List[str]:
+    """Convert students and write the students + schedule JSON, returning summary lines"""
+    students_file = os.path.join(outdir, 'musicdott2_students.json')
+    schedule_file = os.path.join(outdir, 'musicdott2_schedule.json')
+    
+    # Students and their schedule entries go to two files in a single pass
+    with JsonArrayWriter(students_file) as students, JsonArrayWriter(schedule_file) as schedule:
+        writers = {'students': students, 'schedule': schedule}
+        for kind, record in iter_student_records(csv_file):
+            writers[kind].write(record)
+    
+    return [
+        f"✅ Converted {students.count} students to {students_file}",
+        f"✅ Converted {schedule.count} schedule entries to {schedule_file}",
+    ]
+
+
+def _run_jobs(jobs: list, outdir: str) -> List[List[str]]:
+    """Run the conversions (independent files) in separate processes when there are several"""
+    if len(jobs) < 2:
+        return [job(csv_file, outdir) for job, csv_file in jobs]
+    
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(job, csv_file, outdir) for job, csv_file in jobs]
+        return [future.result() for future in futures]
 
 
 def main():
@@ -452,45 +601,22 @@ def main():
     # Ensure output directory exists
     os.makedirs(args.outdir, exist_ok=True)
     
-    # Convert songs if provided
+    jobs = []
     if args.songs and os.path.exists(args.songs):
         print(f"Converting songs from {args.songs}...")
-        songs = convert_songs_csv_to_json(args.songs)
-        
-        output_file = os.path.join(args.outdir, 'musicdott2_songs.json')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(songs, f, ensure_ascii=False, indent=2)
-        
-        print(f"✅ Converted {len(songs)} songs to {output_file}")
+        jobs.append((_songs_job, args.songs))
     
-    # Convert notation if provided  
     if args.notatie and os.path.exists(args.notatie):
         print(f"Converting lessons from {args.notatie}...")
-        lessons = convert_notatie_csv_to_json(args.notatie)
-        
-        output_file = os.path.join(args.outdir, 'musicdott2_lessons.json')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(lessons, f, ensure_ascii=False, indent=2)
-        
-        print(f"✅ Converted {len(lessons)} lessons to {output_file}")
+        jobs.append((_lessons_job, args.notatie))
     
-    # Convert students if provided
     if args.students and os.path.exists(args.students):
         print(f"Converting students and schedule from {args.students}...")
-        students, schedule = convert_students_csv_to_json(args.students)
-        
-        # Save students JSON
-        students_file = os.path.join(args.outdir, 'musicdott2_students.json')
-        with open(students_file, 'w', encoding='utf-8') as f:
-            json.dump(students, f, ensure_ascii=False, indent=2)
-        
-        # Save schedule JSON
-        schedule_file = os.path.join(args.outdir, 'musicdott2_schedule.json')
-        with open(schedule_file, 'w', encoding='utf-8') as f:
-            json.dump(schedule, f, ensure_ascii=False, indent=2)
-        
-        print(f"✅ Converted {len(students)} students to {students_file}")
-        print(f"✅ Converted {len(schedule)} schedule entries to {schedule_file}")
+        jobs.append((_students_job, args.students))
+    
+    for summary in _run_jobs(jobs, args.outdir):
+        for line in summary:
+            print(line)
     
     if not args.songs and not args.notatie and not args.students:
         print("Please provide --songs, --notatie, and/or --students CSV files to convert")
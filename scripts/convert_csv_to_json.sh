@@ -0,0 +1,14 @@
+#!/bin/sh
+# Run the CSV converter under PyPy when it is installed (its JIT speeds up the
+# per-row string handling considerably), otherwise under CPython.
+# Usage: scripts/convert_csv_to_json.sh --songs POS_Songs.csv --outdir export
+DIR=$(dirname "$0")
+
+for interpreter in pypy3 python3 python; do
+    if command -v "$interpreter" >/dev/null 2>&1; then
+        exec "$interpreter" "$DIR/convert_csv_to_json.py" "$@"
+    fi
+done
+
+echo "convert_csv_to_json.sh: no Python interpreter found (tried pypy3, python3, python)" >&2
+exit 1
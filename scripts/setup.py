@@ -0,0 +1,16 @@
+"""
+Optional build of the compiled CSV converter helpers (requires Cython):
+
+    cd scripts && python setup.py build_ext --inplace
+
+convert_csv_to_json.py picks up the resulting _fast extension automatically
+and falls back to its pure-Python helpers when it is missing.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="musicdott-csv-converter-fast",
+    ext_modules=cythonize(["_fast.pyx"], language_level=3),
+)